@@ -1,18 +1,26 @@
 import re
 import json
+import asyncio
 import os  
-import uuid
 import logging
+import functools
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Awaitable, Iterator, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
+from types import MappingProxyType
 
 # ---------- Logging setup ----------
 logger = logging.getLogger("assistant_core")
 logger.setLevel(logging.INFO)
-if not logger.handlers:
+# hasHandlers() also sees root handlers; adding ours on top would print twice.
+if not logger.hasHandlers():
     _handler = logging.StreamHandler()
     _formatter = logging.Formatter("[%(levelname)s] %(message)s")
     _handler.setFormatter(_formatter)
@@ -21,16 +29,38 @@ if not logger.handlers:
 # ---------- xAI Integration (via OpenAI SDK) ----------
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except ImportError:
     OpenAI = None
+    AsyncOpenAI = None
 
-@dataclass
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(raw: Any) -> Any:
+    """
+    Parse JSON from str or bytes, using orjson when installed.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+@dataclass(slots=True)
 class LLMSettings:
     enabled: bool = False
     api_key: Optional[str] = None
     model: str = "grok-beta"
     base_url: str = "https://api.x.ai/v1"
+    # api_key, or XAI_API_KEY from the environment; resolved in configure_llm.
+    resolved_key: Optional[str] = None
 
 _llm_settings = LLMSettings()
 
@@ -42,65 +72,313 @@ def configure_llm(
     """
     Configure xAI settings. 
     """
+    resolved_key = api_key or os.getenv("XAI_API_KEY")
+    if resolved_key != _llm_settings.resolved_key:
+        _get_client.cache_clear()
     _llm_settings.enabled = enabled
     _llm_settings.api_key = api_key
+    _llm_settings.resolved_key = resolved_key
     _llm_settings.model = model or "grok-beta"
     # Hardcoded to xAI
     _llm_settings.base_url = "https://api.x.ai/v1"
 
 def is_llm_configured() -> bool:
+    return _llm_settings.enabled and bool(_llm_settings.resolved_key)
+
+def _resolve_api_key() -> str:
     if not _llm_settings.enabled:
-        return False
-    if _llm_settings.api_key:
-        return True
-    # Check only xAI env var
-    if os.getenv("XAI_API_KEY"):
-        return True
-    return False
+        raise ValueError("xAI is not configured. Check settings.")
+
+    api_key = _llm_settings.resolved_key
+    if not api_key:
+        raise ValueError("No xAI API key found. Please enter it in the sidebar.")
+    return api_key
+
+# Connection pool for the shared sync client; completions are slow, so keep
+# enough idle connections for concurrent UI sessions.
+_LLM_KEEPALIVE = 20
+_LLM_MAX_CONNECTIONS = 40
+_LLM_TIMEOUT_S = 60.0
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str, base_url: str) -> "OpenAI":
+    """
+    One client per credential pair, so its connection pool is reused across calls.
+    """
+    if httpx is None:
+        return OpenAI(api_key=api_key, base_url=base_url)
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=_LLM_KEEPALIVE, max_connections=_LLM_MAX_CONNECTIONS),
+            timeout=_LLM_TIMEOUT_S,
+        ),
+    )
+
+def _build_messages(prompt: str, system_prompt: Optional[str]) -> List[Dict[str, str]]:
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+def _connected_client() -> "OpenAI":
+    if OpenAI is None:
+        raise ImportError("The 'openai' library is missing. Run: pip install openai")
+    return _get_client(_resolve_api_key(), _llm_settings.base_url)
+
+def call_llm_stream(
+    prompt: str,
+    *,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+) -> Iterator[str]:
+    """
+    Call xAI API with streaming, yielding text deltas as they arrive.
+    """
+    client = _connected_client()
+
+    try:
+        stream = client.chat.completions.create(
+            model=_llm_settings.model,
+            messages=_build_messages(prompt, system_prompt),
+            temperature=temperature,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
+    except Exception as e:
+        logger.error("xAI Call Failed: %s", e)
+        raise
+
+# Completed responses keyed by request, so repeating an identical prompt
+# (e.g. a retried auto-fill) does not cost another round-trip. Opt-in per call:
+# user-initiated generation must return a fresh answer each time.
+_LLM_CACHE_SIZE = 512
+_llm_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+def _llm_cache_key(
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    tools: Optional[List[Dict[str, Any]]],
+    tool_choice: Optional[Any],
+) -> Tuple[Any, ...]:
+    # Tool schemas are small nested dicts; their JSON text makes them hashable.
+    tools_key = json.dumps([tools, tool_choice], sort_keys=True) if tools else None
+    return (_llm_settings.model, system_prompt, prompt, round(temperature, 2), tools_key)
+
+def _llm_cache_get(key: Tuple[Any, ...]) -> Optional[str]:
+    with _llm_cache_lock:
+        cached = _llm_cache.get(key)
+        if cached is not None:
+            _llm_cache.move_to_end(key)
+        return cached
+
+def _llm_cache_put(key: Tuple[Any, ...], result: str) -> None:
+    with _llm_cache_lock:
+        _llm_cache[key] = result
+        if len(_llm_cache) > _LLM_CACHE_SIZE:
+            _llm_cache.popitem(last=False)
+
+def clear_llm_cache() -> None:
+    with _llm_cache_lock:
+        _llm_cache.clear()
 
 def call_llm(
     prompt: str,
     *,
     system_prompt: Optional[str] = None,
     temperature: float = 0.7,
-) -> Optional[str]:
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Any] = None,
+    cache: bool = False,
+    stream: bool = False,
+) -> Union[Optional[str], Iterator[str]]:
     """
     Call xAI API.
+    With `tools`, returns the first tool call's JSON arguments string
+    (falling back to the message text if the model made no call).
+    With `cache`, identical requests are answered from an in-process LRU
+    cache; use it only for deterministic extraction, never for generation the
+    user asked for. Empty replies are never cached. Callers that parse the
+    reply should use call_llm_json, which caches only replies that parse.
+    With `stream`, returns an iterator of text deltas instead (never cached).
     """
-    if OpenAI is None:
-        raise ImportError("The 'openai' library is missing. Run: pip install openai")
-
-    if not is_llm_configured():
-        raise ValueError("xAI is not configured. Check settings.")
+    if stream:
+        if tools:
+            raise ValueError("Streaming is not supported with tools")
+        return call_llm_stream(prompt, system_prompt=system_prompt, temperature=temperature)
+
+    key = _llm_cache_key(prompt, system_prompt, temperature, tools, tool_choice) if cache else None
+    if key is not None:
+        cached = _llm_cache_get(key)
+        if cached is not None:
+            return cached
+
+    result = _call_llm_uncached(
+        prompt,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        tools=tools,
+        tool_choice=tool_choice,
+    )
+
+    if key is not None and result:
+        _llm_cache_put(key, result)
+    return result
+
+def _call_llm_uncached(
+    prompt: str,
+    *,
+    system_prompt: Optional[str],
+    temperature: float,
+    tools: Optional[List[Dict[str, Any]]],
+    tool_choice: Optional[Any],
+) -> Optional[str]:
+    if not tools:
+        return "".join(
+            call_llm_stream(prompt, system_prompt=system_prompt, temperature=temperature)
+        )
 
-    # Resolve Credentials
-    api_key = _llm_settings.api_key or os.getenv("XAI_API_KEY")
-    
-    if not api_key:
-        raise ValueError("No xAI API key found. Please enter it in the sidebar.")
+    client = _connected_client()
 
     try:
-        client = OpenAI(
-            api_key=api_key,
-            base_url=_llm_settings.base_url
+        kwargs: Dict[str, Any] = {"tools": tools}
+        if tool_choice is not None:
+            kwargs["tool_choice"] = tool_choice
+
+        completion = client.chat.completions.create(
+            model=_llm_settings.model,
+            messages=_build_messages(prompt, system_prompt),
+            temperature=temperature,
+            **kwargs,
         )
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        message = completion.choices[0].message
+        if message.tool_calls:
+            return message.tool_calls[0].function.arguments
+        return message.content
 
-        completion = client.chat.completions.create(
+    except Exception as e:
+        logger.error("xAI Call Failed: %s", e)
+        raise
+
+def _new_async_client() -> "AsyncOpenAI":
+    # Not cached process-wide: an async client is bound to the event loop it
+    # first runs on, and each asyncio.run() starts a fresh loop.
+    if AsyncOpenAI is None:
+        raise ImportError("The 'openai' library is missing. Run: pip install openai")
+    return AsyncOpenAI(api_key=_resolve_api_key(), base_url=_llm_settings.base_url)
+
+async def call_llm_async(
+    prompt: str,
+    *,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    client: Optional["AsyncOpenAI"] = None,
+) -> Optional[str]:
+    """
+    Async variant of call_llm, so several completions can be awaited together.
+    Pass `client` to share one connection pool across a batch of calls.
+    """
+    if client is None:
+        client = _new_async_client()
+
+    try:
+        completion = await client.chat.completions.create(
             model=_llm_settings.model,
-            messages=messages,
+            messages=_build_messages(prompt, system_prompt),
             temperature=temperature,
         )
-        
+
         return completion.choices[0].message.content
 
     except Exception as e:
-        logger.error(f"xAI Call Failed: {e}")
-        raise e
+        logger.error("xAI Call Failed: %s", e)
+        raise
+
+# Upper bound on completions in flight from one fan-out, to stay under the
+# provider's rate limits as the number of parallel prompts grows.
+_LLM_MAX_CONCURRENCY = 8
+
+async def _gather_limited(calls: List[Awaitable[Any]], limit: int = _LLM_MAX_CONCURRENCY) -> List[Any]:
+    """
+    asyncio.gather with at most `limit` awaitables running at once.
+    The semaphore is created per call: it must belong to the running loop.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(call: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await call
+
+    return await asyncio.gather(*[run(call) for call in calls])
+
+# Markdown code fence around a JSON reply, optionally tagged ```json.
+_FENCE_RE = re.compile(r'\A\s*```(?:json)?\s*|\s*```\s*\Z', re.IGNORECASE)
+
+def _parse_llm_json(raw: str) -> Any:
+    return _json_loads(_FENCE_RE.sub('', raw))
+
+def call_llm_json(
+    prompt: str,
+    *,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Any] = None,
+    cache: bool = False,
+) -> Any:
+    """
+    call_llm for JSON replies: returns the parsed value, or None if the reply
+    was empty. With `cache`, a reply is cached only once it parses, so a
+    malformed answer is re-requested on retry instead of replayed.
+    """
+    key = _llm_cache_key(prompt, system_prompt, temperature, tools, tool_choice) if cache else None
+    raw = _llm_cache_get(key) if key is not None else None
+    if raw is not None:
+        return _parse_llm_json(raw)
+
+    raw = call_llm(
+        prompt,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        tools=tools,
+        tool_choice=tool_choice,
+        cache=False,
+    )
+    if not raw:
+        return None
+    parsed = _parse_llm_json(raw)
+    if key is not None:
+        _llm_cache_put(key, raw)
+    return parsed
+
+_ESSAY_PARAMS_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "extract_essay_params",
+        "description": "Record the essay parameters found in a task description.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "topic": {"type": "string"},
+                "essay_type": {
+                    "type": "string",
+                    "enum": ["opinion", "analytical", "comparative", "interpretive"],
+                },
+                "word_count": {"type": "integer"},
+                "deadline": {"type": "string", "description": "YYYY-MM-DD"},
+            },
+            "required": ["topic", "essay_type", "word_count"],
+        },
+    },
+}
 
 def infer_essay_parameters_from_text(description: str) -> Dict[str, Any]:
     """
@@ -109,53 +387,97 @@ def infer_essay_parameters_from_text(description: str) -> Dict[str, Any]:
     if not is_llm_configured():
         raise RuntimeError("xAI is not configured.")
 
-    prompt = f"""
-    Extract essay parameters from this description: "{description}"
-    Return JSON only:
-    {{
-      "topic": "...",
-      "essay_type": "one of [opinion, analytical, comparative, interpretive]",
-      "word_count": 1000,
-      "deadline": "YYYY-MM-DD"
-    }}
-    """
+    prompt = f'Extract essay parameters from this description: "{description}"'
     # Using specific error handling for the auto-fill feature
     try:
-        raw = call_llm(prompt, temperature=0.2)
-        if raw.startswith("```"):
-            raw = raw.strip().strip("`").replace("json", "")
-        return json.loads(raw)
+        params = call_llm_json(
+            prompt,
+            temperature=0.2,
+            tools=[_ESSAY_PARAMS_TOOL],
+            tool_choice={"type": "function", "function": {"name": "extract_essay_params"}},
+            cache=True,
+        )
+        if params is None:
+            raise ValueError("xAI returned no essay parameters")
+        return params
     except Exception as e:
-        logger.error(f"Auto-fill failed: {e}")
+        logger.error("Auto-fill failed: %s", e)
         # Raise it so the UI shows the error instead of silently failing
-        raise e
+        raise
 
 # ========== BASE TASK SYSTEM (Unchanged) ==========
 
+# Short ids are sliced out of one large random block, so a batch of sections
+# costs one urandom read instead of one uuid4() per id.
+_ID_LEN = 8
+_id_pool: List[str] = []
+_id_lock = threading.Lock()
+
+def _next_id() -> str:
+    with _id_lock:
+        if not _id_pool:
+            block = secrets.token_hex(256)
+            _id_pool.extend(block[i:i + _ID_LEN] for i in range(0, len(block), _ID_LEN))
+        return _id_pool.pop()
+
 class TaskStatus(Enum):
     INITIALIZED = "initialized"
     ACTIVE = "active"
     COMPLETED = "completed"
 
+_STATUS_BY_VALUE = {s.value: s for s in TaskStatus}
+
 class Task(ABC):
     def __init__(self, params: Dict[str, Any], task_id: Optional[str] = None, status: TaskStatus = TaskStatus.INITIALIZED):
-        self.id = task_id or f"task_{uuid.uuid4().hex[:9]}"
+        self.id = task_id or f"task_{_next_id()}"
         self.type = self.__class__.__name__
-        self.created_at = datetime.now()
+        self.created_at_ts = time.time()
         self.status = status
         self.params = params or {}
 
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ts)
+
     @abstractmethod
     def start(self) -> Dict[str, Any]: pass
 
 # ========== ESSAY DATA MODELS ==========
 
-@dataclass
+class SectionKind(Enum):
+    INTRO = "intro"
+    BODY = "body"
+    CONCLUSION = "conclusion"
+
+_KIND_BY_VALUE = {k.value: k for k in SectionKind}
+
+# Read-only views, so a caller can't mutate the shared defaults in place.
+_TREE_DEFAULTS: Dict[SectionKind, "MappingProxyType[str, str]"] = {
+    SectionKind.INTRO: MappingProxyType({"T": "Topic/Hook", "R": "Reasons preview", "E1": "Context", "E2": "Thesis"}),
+    SectionKind.BODY: MappingProxyType({"T": "Topic Sentence", "R": "Reasons/Evidence", "E1": "Explanation", "E2": "Transition"}),
+    SectionKind.CONCLUSION: MappingProxyType({"T": "Restate Thesis", "R": "Recap Reasons", "E1": "Significance", "E2": "Final Thought"}),
+}
+
+def _section_kind_for(title: str) -> SectionKind:
+    # Title heuristic, only used when a section is created without a kind
+    # (user-added rows, or state saved before kinds were stored).
+    if "Intro" in title:
+        return SectionKind.INTRO
+    if "Conclu" in title:
+        return SectionKind.CONCLUSION
+    return SectionKind.BODY
+
+@dataclass(slots=True)
 class OutlineSection:
     title: str
     word_count: int
     guiding_question: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=_next_id)
+    kind: Optional[SectionKind] = None
+
+    def __post_init__(self):
+        if self.kind is None:
+            self.kind = _section_kind_for(self.title)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -163,6 +485,7 @@ class OutlineSection:
             "word_count": self.word_count,
             "guiding_question": self.guiding_question,
             "id": self.id,
+            "kind": self.kind.value,
         }
 
     @staticmethod
@@ -171,10 +494,11 @@ class OutlineSection:
             title=data.get("title", ""),
             word_count=int(data.get("word_count", 0)),
             guiding_question=data.get("guiding_question", ""),
-            id=data.get("id") or str(uuid.uuid4())[:8],
+            id=data.get("id") or _next_id(),
+            kind=_KIND_BY_VALUE.get(data.get("kind")),
         )
 
-@dataclass
+@dataclass(slots=True)
 class Outline:
     sections: List[OutlineSection] = field(default_factory=list)
 
@@ -188,7 +512,7 @@ class Outline:
         sections = [OutlineSection.from_dict(s) for s in data.get("sections", [])]
         return Outline(sections=sections)
 
-@dataclass
+@dataclass(slots=True)
 class EssaySection:
     title: str
     target_words: int
@@ -220,11 +544,11 @@ class EssaySection:
             content=data.get("content", ""),
             actual_words=int(data.get("actual_words", 0)),
             completed=bool(data.get("completed", False)),
-            tree_prompts=data.get("tree_prompts", {}) or {},
+            tree_prompts=data.get("tree_prompts") or {},
             id=data.get("id", ""),
         )
 
-@dataclass
+@dataclass(slots=True)
 class RevisionIssue:
     issue_type: str
     description: str
@@ -251,26 +575,30 @@ class RevisionIssue:
             suggestion=data.get("suggestion"),
         )
 
-@dataclass
+@dataclass(slots=True)
 class EssayData:
     topic: str = ""
     essay_type: str = ""
     word_count: int = 0
-    deadline: Optional[datetime] = None
+    deadline: Optional[str] = None  # ISO-8601; see deadline_at
     thesis: str = ""
     thesis_suggestions: List[str] = field(default_factory=list)
     outline: Optional[Outline] = None
     sections: List[EssaySection] = field(default_factory=list)
     revision_passes: List[RevisionIssue] = field(default_factory=list)
 
+    @property
+    def deadline_at(self) -> Optional[datetime]:
+        return datetime.fromisoformat(self.deadline) if self.deadline else None
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "topic": self.topic,
             "essay_type": self.essay_type,
             "word_count": self.word_count,
-            "deadline": self.deadline.isoformat() if self.deadline else None,
+            "deadline": self.deadline,
             "thesis": self.thesis,
-            "thesis_suggestions": list(self.thesis_suggestions),
+            "thesis_suggestions": self.thesis_suggestions,
             "outline": self.outline.to_dict() if self.outline else None,
             "sections": [s.to_dict() for s in self.sections],
             "revision_passes": [i.to_dict() for i in self.revision_passes],
@@ -279,15 +607,13 @@ class EssayData:
     @staticmethod
     def from_dict(data: Optional[Dict[str, Any]]) -> "EssayData":
         data = data or {}
-        deadline = data.get("deadline")
-        parsed_deadline = datetime.fromisoformat(deadline) if deadline else None
         return EssayData(
             topic=data.get("topic", ""),
             essay_type=data.get("essay_type", ""),
             word_count=int(data.get("word_count", 0)),
-            deadline=parsed_deadline,
+            deadline=data.get("deadline") or None,
             thesis=data.get("thesis", ""),
-            thesis_suggestions=data.get("thesis_suggestions", []) or [],
+            thesis_suggestions=data.get("thesis_suggestions") or [],
             outline=Outline.from_dict(data.get("outline")),
             sections=[EssaySection.from_dict(s) for s in data.get("sections", [])],
             revision_passes=[RevisionIssue.from_dict(i) for i in data.get("revision_passes", [])],
@@ -295,6 +621,36 @@ class EssayData:
 
 # ========== ESSAY STAGES ==========
 
+# List markers the model tends to prefix suggestions with ("1.", "-", "•").
+_PREFIX_RE = re.compile(r'^[\d.\-*•\s]+')
+
+def _clean_suggestion_lines(res: str) -> List[str]:
+    cleaned = (_PREFIX_RE.sub('', line).rstrip() for line in res.splitlines())
+    return [line for line in cleaned if line]
+
+def _outline_from_plan(data: Any) -> Optional[Outline]:
+    """
+    Build an outline from a model-written plan, skipping sections whose fields
+    have the wrong shape. Returns None when no usable section is left.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("sections"), list):
+        return None
+    sections = []
+    for raw in data["sections"]:
+        if not isinstance(raw, dict):
+            continue
+        title = raw.get("title")
+        word_count = raw.get("word_count")
+        guiding_question = raw.get("guiding_question") or ""
+        if not isinstance(title, str) or not title.strip():
+            continue
+        if isinstance(word_count, bool) or not isinstance(word_count, (int, float)) or word_count <= 0:
+            continue
+        if not isinstance(guiding_question, str):
+            continue
+        sections.append(OutlineSection(title=title.strip(), word_count=int(word_count), guiding_question=guiding_question))
+    return Outline(sections=sections) if sections else None
+
 class EssayAssistantTask(Task):
     def __init__(self, params: Dict[str, Any], task_id: Optional[str] = None, status: TaskStatus = TaskStatus.INITIALIZED):
         super().__init__(params, task_id=task_id, status=status)
@@ -336,82 +692,146 @@ class EssayAssistantTask(Task):
         return {"message": "Thesis saved"}
 
     def generate_thesis_suggestions(self):
+        asyncio.run(self.generate_thesis_suggestions_async())
+
+    async def generate_thesis_suggestions_async(self):
+        """
+        Request the three suggestions as separate, concurrent completions at
+        different temperatures instead of one list-shaped answer.
+        """
         if not is_llm_configured():
             raise ValueError("xAI not configured")
-        
-        prompt = f"Generate 3 distinct, arguable thesis statements for an {self.essay_data.essay_type} essay on: {self.essay_data.topic}. Return only the statements as a list."
-        res = call_llm(prompt)
-        if res:
-            self.essay_data.thesis_suggestions = [
-                line.strip().lstrip("1234567890.-*• ") 
-                for line in res.split('\n') 
-                if line.strip()
-            ][:3]
+
+        prompt = f"Generate one arguable thesis statement for an {self.essay_data.essay_type} essay on: {self.essay_data.topic}. Return only the statement."
+        client = _new_async_client()
+        try:
+            results = await _gather_limited(
+                [call_llm_async(prompt, temperature=t, client=client) for t in (0.5, 0.8, 1.1)]
+            )
+        finally:
+            await client.close()
+        suggestions = []
+        for res in results:
+            lines = _clean_suggestion_lines(res) if res else []
+            if lines:
+                suggestions.append(lines[0])
+        if suggestions:
+            self.essay_data.thesis_suggestions = suggestions
+
+    def bootstrap_with_llm(self):
+        """
+        Fetch thesis suggestions and an outline in a single request instead of
+        one round-trip per step. Parts of the reply with the wrong shape are
+        ignored; falls back to the default outline when no section is usable.
+        """
+        if not is_llm_configured():
+            raise ValueError("xAI not configured")
+
+        prompt = f"""
+        Plan an {self.essay_data.essay_type} essay on: {self.essay_data.topic}
+        Target length: {self.essay_data.word_count} words.
+        Return JSON only:
+        {{
+          "thesis_suggestions": ["three distinct, arguable thesis statements"],
+          "outline": {{
+            "sections": [
+              {{"title": "Introduction", "word_count": 150, "guiding_question": "..."}}
+            ]
+          }}
+        }}
+        Section word counts must add up to the target length.
+        """
+        plan = call_llm_json(prompt)
+        if not isinstance(plan, dict):
+            return
+
+        suggestions = plan.get("thesis_suggestions")
+        if isinstance(suggestions, list):
+            suggestions = [s for s in suggestions if isinstance(s, str) and s.strip()]
+            if suggestions:
+                self.essay_data.thesis_suggestions = suggestions[:3]
+
+        if self.essay_data.outline is None:
+            outline = _outline_from_plan(plan.get("outline"))
+            if outline:
+                self.essay_data.outline = outline
+            else:
+                self.generate_initial_outline()
 
     def generate_initial_outline(self):
         wc = self.essay_data.word_count
         sections = [
-            OutlineSection("Introduction", int(wc * 0.15), "Hook and Thesis"),
-            OutlineSection("Body Paragraph 1", int(wc * 0.25), "First Argument"),
-            OutlineSection("Body Paragraph 2", int(wc * 0.25), "Second Argument"),
-            OutlineSection("Body Paragraph 3", int(wc * 0.20), "Third Argument"),
-            OutlineSection("Conclusion", int(wc * 0.15), "Summary and Final Thought")
+            OutlineSection("Introduction", int(wc * 0.15), "Hook and Thesis", kind=SectionKind.INTRO),
+            OutlineSection("Body Paragraph 1", int(wc * 0.25), "First Argument", kind=SectionKind.BODY),
+            OutlineSection("Body Paragraph 2", int(wc * 0.25), "Second Argument", kind=SectionKind.BODY),
+            OutlineSection("Body Paragraph 3", int(wc * 0.20), "Third Argument", kind=SectionKind.BODY),
+            OutlineSection("Conclusion", int(wc * 0.15), "Summary and Final Thought", kind=SectionKind.CONCLUSION)
         ]
         self.essay_data.outline = Outline(sections)
 
     def update_outline(self, new_sections_data: List[Dict]):
+        # Sections keep the kind they were created with across edits.
+        outline = self.essay_data.outline
+        kinds = {s.id: s.kind for s in outline.sections} if outline else {}
         new_sections = []
         for s in new_sections_data:
+            sid = s.get('id') or _next_id()
             new_sections.append(OutlineSection(
                 title=s['title'],
                 word_count=int(s['word_count']),
                 guiding_question=s.get('guiding_question', ''),
-                id=s.get('id') or str(uuid.uuid4())[:8]
+                id=sid,
+                kind=kinds.get(sid)
             ))
         self.essay_data.outline = Outline(new_sections)
 
     def sync_outline_to_sections(self):
-        current_map = {s.id: s for s in self.essay_data.sections}
+        # Popping matched ids leaves only sections dropped from the outline,
+        # and keeps a duplicated outline id from sharing one EssaySection.
+        remaining = {s.id: s for s in self.essay_data.sections}
         new_sections = []
         for out_sec in self.essay_data.outline.sections:
-            existing = current_map.get(out_sec.id)
+            oid, title = out_sec.id, out_sec.title
+            target, question = out_sec.word_count, out_sec.guiding_question
+            existing = remaining.pop(oid, None)
             if existing:
-                existing.title = out_sec.title
-                existing.target_words = out_sec.word_count
-                existing.guiding_question = out_sec.guiding_question
+                existing.title = title
+                existing.target_words = target
+                existing.guiding_question = question
                 new_sections.append(existing)
             else:
                 new_sections.append(EssaySection(
-                    title=out_sec.title,
-                    target_words=out_sec.word_count,
-                    guiding_question=out_sec.guiding_question,
-                    id=out_sec.id,
-                    tree_prompts=self._get_tree_defaults(out_sec.title)
+                    title=title,
+                    target_words=target,
+                    guiding_question=question,
+                    id=oid,
+                    tree_prompts=self._get_tree_defaults(out_sec)
                 ))
         self.essay_data.sections = new_sections
 
-    def _get_tree_defaults(self, title):
-        if "Intro" in title:
-            return {"T": "Topic/Hook", "R": "Reasons preview", "E1": "Context", "E2": "Thesis"}
-        elif "Conclu" in title:
-            return {"T": "Restate Thesis", "R": "Recap Reasons", "E1": "Significance", "E2": "Final Thought"}
-        else:
-            return {"T": "Topic Sentence", "R": "Reasons/Evidence", "E1": "Explanation", "E2": "Transition"}
+    def _get_tree_defaults(self, out_sec: OutlineSection) -> Dict[str, str]:
+        # Copied so edits to one section's prompts don't leak into the table.
+        return dict(_TREE_DEFAULTS[out_sec.kind])
 
     def save_section_content(self, idx: int, content: str):
         if 0 <= idx < len(self.essay_data.sections):
-            self.essay_data.sections[idx].content = content
-            self.essay_data.sections[idx].actual_words = len(content.split())
-            self.essay_data.sections[idx].completed = True
+            section = self.essay_data.sections[idx]
+            section.content = content
+            # str.split counts words faster than any regex scan, list included
+            section.actual_words = len(content.split())
+            section.completed = True
 
     def run_revision(self):
         issues = []
-        total_words = sum(s.actual_words for s in self.essay_data.sections)
-        if abs(total_words - self.essay_data.word_count) > self.essay_data.word_count * 0.1:
-            issues.append(RevisionIssue("word_count", f"Total words ({total_words}) deviates from target ({self.essay_data.word_count})", "Overall", "high"))
+        total_words = 0
         for s in self.essay_data.sections:
+            total_words += s.actual_words
             if s.actual_words < s.target_words * 0.5:
-                 issues.append(RevisionIssue("word_count", f"Section '{s.title}' is too short", s.title, "medium"))
+                issues.append(RevisionIssue("word_count", f"Section '{s.title}' is too short", s.title, "medium"))
+        target = self.essay_data.word_count
+        if abs(total_words - target) > target * 0.1:
+            # The overall issue is listed first, ahead of per-section ones.
+            issues.insert(0, RevisionIssue("word_count", f"Total words ({total_words}) deviates from target ({target})", "Overall", "high"))
         self.essay_data.revision_passes = issues
 
     def get_full_draft(self) -> str:
@@ -429,7 +849,7 @@ class EssayAssistantTask(Task):
 
     @staticmethod
     def from_state(state: Dict[str, Any]) -> "EssayAssistantTask":
-        status = TaskStatus(state.get("status", TaskStatus.INITIALIZED.value))
+        status = _STATUS_BY_VALUE.get(state.get("status"), TaskStatus.INITIALIZED)
         task = EssayAssistantTask(
             state.get("params", {}),
             task_id=state.get("id"),
@@ -441,19 +861,35 @@ class EssayAssistantTask(Task):
 
 # ========== READING ASSISTANT TASK ==========
 
-@dataclass
+# Blank line, allowing stray spaces/tabs on it (e.g. "\n \n").
+_PARA_RE = re.compile(r'\n[\t ]*\n')
+
+@dataclass(slots=True)
 class ReadingSource:
     id: str
     title: str
-    paragraphs: List[str]
+    paragraphs: Tuple[str, ...]
     current_index: int = 0 
+    # Derived from paragraphs/current_index; kept so progress polling is O(1).
+    total: int = field(init=False, default=0)
+    percent: float = field(init=False, default=0)
+
+    def __post_init__(self):
+        self.total = len(self.paragraphs)
+        self.percent = self.current_index / self.total if self.total else 0
+
+    def advance(self) -> None:
+        if self.current_index < self.total:
+            self.current_index += 1
+            self.percent = self.current_index / self.total
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "title": self.title,
-            "paragraphs": list(self.paragraphs),
+            "paragraphs": self.paragraphs,
             "current_index": self.current_index,
+            "total": self.total,
         }
 
     @staticmethod
@@ -461,7 +897,7 @@ class ReadingSource:
         return ReadingSource(
             id=data.get("id", ""),
             title=data.get("title", ""),
-            paragraphs=data.get("paragraphs", []) or [],
+            paragraphs=tuple(data.get("paragraphs") or ()),
             current_index=int(data.get("current_index", 0)),
         )
 
@@ -470,29 +906,40 @@ class ReadingAssistantTask(Task):
         super().__init__(params, task_id=task_id, status=status)
         self.sources: List[ReadingSource] = []
         self.current_source_idx: Optional[int] = None
+        # Indices of unfinished sources, in round-robin order from the current one.
+        self._pending: deque = deque()
+
+    def _rebuild_pending(self):
+        n = len(self.sources)
+        start = self.current_source_idx or 0
+        self._pending = deque(
+            i for i in ((start + k) % n for k in range(n))
+            if self.sources[i].current_index < self.sources[i].total
+        )
 
     def start(self):
         raw_texts = self.params.get("texts", [])
         for i, t in enumerate(raw_texts):
             text_content = t.get("text", "") if isinstance(t, dict) else t
             title = t.get("title", f"Text {i+1}") if isinstance(t, dict) else f"Text {i+1}"
-            paras = [p.strip() for p in text_content.split('\n\n') if p.strip()]
+            paras = tuple(p for p in map(str.strip, _PARA_RE.split(text_content)) if p)
             self.sources.append(ReadingSource(f"src_{i}", title, paras))
         
         if self.sources:
             self.current_source_idx = 0
             self.status = TaskStatus.ACTIVE
+        self._rebuild_pending()
         return {"message": "Reading started"}
 
     def get_current_chunk(self):
         if self.current_source_idx is None: return None
         src = self.sources[self.current_source_idx]
-        if src.current_index < len(src.paragraphs):
+        if src.current_index < src.total:
             return {
                 "source_title": src.title,
                 "text": src.paragraphs[src.current_index],
                 "para_num": src.current_index + 1,
-                "total_paras": len(src.paragraphs),
+                "total_paras": src.total,
                 "is_finished": False
             }
         else:
@@ -501,28 +948,26 @@ class ReadingAssistantTask(Task):
     def advance(self, mode: str):
         if self.current_source_idx is None: return
         current_src = self.sources[self.current_source_idx]
-        
-        if current_src.current_index < len(current_src.paragraphs):
-            current_src.current_index += 1
-
-        if mode == 'switch':
-            start = self.current_source_idx
-            for i in range(1, len(self.sources) + 1):
-                idx = (start + i) % len(self.sources)
-                if self.sources[idx].current_index < len(self.sources[idx].paragraphs):
-                    self.current_source_idx = idx
-                    return
-        elif mode == 'continue':
-            if current_src.current_index >= len(current_src.paragraphs):
-                self.advance(mode='switch')
+        current_src.advance()
+        finished = current_src.current_index >= current_src.total
+
+        pending = self._pending
+        if pending and pending[0] == self.current_source_idx:
+            if finished:
+                pending.popleft()
+            elif mode == 'switch':
+                pending.rotate(-1)
+
+        if pending and (mode == 'switch' or (mode == 'continue' and finished)):
+            self.current_source_idx = pending[0]
 
     def get_progress(self):
         return [
             {
                 "title": s.title,
                 "read": s.current_index,
-                "total": len(s.paragraphs),
-                "percent": s.current_index / len(s.paragraphs) if s.paragraphs else 0
+                "total": s.total,
+                "percent": s.percent
             }
             for s in self.sources
         ]
@@ -539,7 +984,7 @@ class ReadingAssistantTask(Task):
 
     @staticmethod
     def from_state(state: Dict[str, Any]) -> "ReadingAssistantTask":
-        status = TaskStatus(state.get("status", TaskStatus.INITIALIZED.value))
+        status = _STATUS_BY_VALUE.get(state.get("status"), TaskStatus.INITIALIZED)
         task = ReadingAssistantTask(
             state.get("params", {}),
             task_id=state.get("id"),
@@ -547,19 +992,26 @@ class ReadingAssistantTask(Task):
         )
         task.current_source_idx = state.get("current_source_idx")
         task.sources = [ReadingSource.from_dict(s) for s in state.get("sources", [])]
+        task._rebuild_pending()
         return task
 
 
+_TASK_CTORS = {
+    "essay": EssayAssistantTask.from_state,
+    "reading": ReadingAssistantTask.from_state,
+}
+
 def task_from_state(state: Dict[str, Any]) -> Task:
     task_type = state.get("task_type")
-    if task_type == "essay":
-        return EssayAssistantTask.from_state(state)
-    if task_type == "reading":
-        return ReadingAssistantTask.from_state(state)
-    raise ValueError(f"Unknown task_type: {task_type}")
+    ctor = _TASK_CTORS.get(task_type)
+    if ctor is None:
+        raise ValueError(f"Unknown task_type: {task_type}")
+    return ctor(state)
 
 # ========== TASK MANAGER ==========
 
+_TASK_ROW = attrgetter("id", "type", "status.value")
+
 class TaskManager:
     def __init__(self):
         self.tasks: Dict[str, Task] = {}
@@ -576,7 +1028,10 @@ class TaskManager:
         return self.tasks.get(id_)
 
     def get_all_tasks(self):
-        return [{"id": t.id, "type": t.type, "status": t.status.value} for t in self.tasks.values()]
+        return [
+            {"id": task_id, "type": task_type, "status": status}
+            for task_id, task_type, status in map(_TASK_ROW, self.tasks.values())
+        ]
     
     def delete_task(self, id_: str):
         if id_ in self.tasks:
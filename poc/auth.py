@@ -3,6 +3,7 @@ import secrets
 from typing import Dict, Optional, Tuple
 
 from authlib.integrations.requests_client import OAuth2Session
+from requests.adapters import HTTPAdapter
 
 
 GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
@@ -11,12 +12,22 @@ GOOGLE_USERINFO_URL = "https://openidconnect.googleapis.com/v1/userinfo"
 GOOGLE_SCOPES = ["openid", "email", "profile"]
 
 
+_google_config: Optional[Dict[str, str]] = None
+# Sessions are built per call so tokens and cookies never cross users; they
+# share this adapter, whose urllib3 pool is thread-safe, to keep connections to
+# Google's endpoints alive between the code exchange and the userinfo fetch.
+_https_adapter = HTTPAdapter()
+
+
 def get_google_config() -> Dict[str, str]:
-    return {
-        "client_id": os.getenv("GOOGLE_CLIENT_ID", ""),
-        "client_secret": os.getenv("GOOGLE_CLIENT_SECRET", ""),
-        "redirect_uri": os.getenv("APP_BASE_URL", "http://localhost:8501"),
-    }
+    global _google_config
+    if _google_config is None:
+        _google_config = {
+            "client_id": os.getenv("GOOGLE_CLIENT_ID", ""),
+            "client_secret": os.getenv("GOOGLE_CLIENT_SECRET", ""),
+            "redirect_uri": os.getenv("APP_BASE_URL", "http://localhost:8501"),
+        }
+    return _google_config
 
 
 def build_oauth_session(
@@ -26,7 +37,7 @@ def build_oauth_session(
     state: Optional[str] = None,
     token: Optional[Dict] = None,
 ) -> OAuth2Session:
-    return OAuth2Session(
+    oauth = OAuth2Session(
         client_id=client_id,
         client_secret=client_secret,
         scope=GOOGLE_SCOPES,
@@ -34,6 +45,8 @@ def build_oauth_session(
         state=state,
         token=token,
     )
+    oauth.mount("https://", _https_adapter)
+    return oauth
 
 
 def generate_state_and_nonce() -> Tuple[str, str]:
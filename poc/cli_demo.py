@@ -3,18 +3,23 @@
 import re
 import json
 from abc import ABC, abstractmethod
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from time import time_ns
+from typing import List, Dict, Any, Optional, Tuple, Type
 from dataclasses import dataclass, field
 from enum import Enum
 
-import uuid
+import os
 import random
 
 
 # ========== BASE TASK SYSTEM ==========
 
-class TaskStatus(Enum):
+class TaskStatus(str, Enum):
     INITIALIZED = "initialized"
     ACTIVE = "active"
     COMPLETED = "completed"
@@ -27,13 +32,25 @@ class Task(ABC):
     def __init__(self, params: Dict[str, Any]):
         self.id = self._generate_id()
         self.type = self.__class__.__name__
-        self.created_at = datetime.now()
+        self.created_at_ns = time_ns()
+        self._created_at_iso: Optional[str] = None
         self.status = TaskStatus.INITIALIZED
         self.current_stage = 0
         self.params = params or {}
     
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
+    
+    @property
+    def created_at_iso(self) -> str:
+        # Formatted once; task listings are polled repeatedly
+        if self._created_at_iso is None:
+            self._created_at_iso = self.created_at.isoformat()
+        return self._created_at_iso
+    
     def _generate_id(self) -> str:
-        return f"task_{uuid.uuid4().hex[:9]}"
+        return f"task_{os.urandom(5).hex()[:9]}"
     
     @abstractmethod
     def validate_params(self) -> bool:
@@ -56,26 +73,35 @@ class Task(ABC):
             'status': self.status.value,
             'current_stage': self.current_stage,
             'params': self.params,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at_iso
         }
 
 
 class TaskFactory:
     """Factory for creating different task types"""
     
-    @staticmethod
-    def create_task(task_type: str, params: Dict[str, Any]) -> Task:
-        if task_type == 'essay':
-            return EssayAssistantTask(params)
-        elif task_type == 'reading':
-            return ReadingAssistantTask(params)
-        else:
-            raise ValueError(f"Unknown task type: {task_type}")
+    _registry: Dict[str, Type[Task]] = {}
+    
+    @classmethod
+    def register(cls, task_type: str):
+        """Class decorator adding a Task subclass under `task_type`"""
+        def decorator(task_cls: Type[Task]) -> Type[Task]:
+            cls._registry[task_type] = task_cls
+            return task_cls
+        return decorator
+    
+    @classmethod
+    def create_task(cls, task_type: str, params: Dict[str, Any]) -> Task:
+        try:
+            task_cls = cls._registry[task_type]
+        except KeyError:
+            raise ValueError(f"Unknown task type: {task_type}") from None
+        return task_cls(params)
 
 
 # ========== ESSAY DATA MODELS ==========
 
-@dataclass
+@dataclass(slots=True)
 class EssayData:
     """Core essay data structure"""
     topic: str = ""
@@ -87,9 +113,34 @@ class EssayData:
     sections: List['EssaySection'] = field(default_factory=list)
     revision_passes: List['RevisionIssue'] = field(default_factory=list)
     timeline: Optional[Dict[str, Any]] = None
+    completed_count: int = 0  # sections with completed=True
+    total_words: int = 0  # sum of section actual_words
+    high_issue_count: int = 0  # high-severity revision issues
+    
+    def set_sections(self, sections: List['EssaySection']):
+        """Replace the sections and recount the totals kept for them"""
+        self.sections = sections
+        self.completed_count = sum(1 for s in sections if s.completed)
+        self.total_words = sum(s.actual_words for s in sections)
+    
+    def set_revision_passes(self, issues: List['RevisionIssue']):
+        """Replace the revision issues and recount the high-severity ones"""
+        self.revision_passes = issues
+        self.high_issue_count = sum(1 for i in issues if i.severity == 'high')
+
+
+@dataclass(slots=True, frozen=True)
+class TimelineStage:
+    """One stage of the suggested essay timeline"""
+    name: str
+    days: int
+    start_day: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'name': self.name, 'days': self.days, 'start_day': self.start_day}
 
 
-@dataclass
+@dataclass(slots=True)
 class OutlineSection:
     """Individual section in the outline"""
     title: str
@@ -99,7 +150,7 @@ class OutlineSection:
     completed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Outline:
     """Essay outline with word distribution"""
     sections: List[OutlineSection] = field(default_factory=list)
@@ -123,7 +174,7 @@ class Outline:
         ]
 
 
-@dataclass
+@dataclass(slots=True)
 class EssaySection:
     """Individual essay section with content"""
     title: str
@@ -133,9 +184,19 @@ class EssaySection:
     actual_words: int = 0
     completed: bool = False
     tree_prompts: Dict[str, str] = field(default_factory=dict)
+    _content_lower: str = field(default="", init=False, repr=False, compare=False)
+    _lowered_from: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def content_lower(self) -> str:
+        # Recomputed only when `content` has been reassigned since the last call.
+        if self._lowered_from is not self.content:
+            self._content_lower = self.content.lower()
+            self._lowered_from = self.content
+        return self._content_lower
 
 
-@dataclass
+@dataclass(slots=True)
 class RevisionIssue:
     """Issue found during revision"""
     issue_type: str
@@ -210,6 +271,13 @@ class PickIdeasStage(EssayStage):
         return bool(essay_data.thesis)
 
 
+_ORDINALS = ('first', 'second', 'third', 'fourth', 'fifth')
+
+
+def _ordinal(n: int) -> str:
+    return _ORDINALS[n - 1] if n <= len(_ORDINALS) else f'{n}th'
+
+
 class OrganizeStage(EssayStage):
     def validate_custom_outline(self, essay_data: EssayData) -> List[str]:
         errors = []
@@ -259,7 +327,6 @@ class OrganizeStage(EssayStage):
     
     def _generate_outline(self, essay_data: EssayData) -> Outline:
         total_words = essay_data.word_count
-        sections = []
         
         # Word distribution (MVP percentages)
         intro_words = round(total_words * 0.125)  # 12.5%
@@ -271,24 +338,26 @@ class OrganizeStage(EssayStage):
         words_per_body_para = round(body_words / body_para_count)
         
         # Create sections
-        sections.append(OutlineSection(
-            'Introduction',
-            intro_words,
-            'How will you introduce the topic and present your thesis?'
-        ))
-        
-        for i in range(1, body_para_count + 1):
-            sections.append(OutlineSection(
-                f'Body Paragraph {i}',
-                words_per_body_para,
-                f'What is your {self._get_ordinal(i)} main argument supporting your thesis?'
-            ))
-        
-        sections.append(OutlineSection(
-            'Conclusion',
-            conclusion_words,
-            'How will you summarize and reinforce your thesis?'
-        ))
+        sections = [
+            OutlineSection(
+                'Introduction',
+                intro_words,
+                'How will you introduce the topic and present your thesis?'
+            ),
+            *(
+                OutlineSection(
+                    f'Body Paragraph {i}',
+                    words_per_body_para,
+                    f'What is your {_ordinal(i)} main argument supporting your thesis?'
+                )
+                for i in range(1, body_para_count + 1)
+            ),
+            OutlineSection(
+                'Conclusion',
+                conclusion_words,
+                'How will you summarize and reinforce your thesis?'
+            )
+        ]
         
         return Outline(sections)
     
@@ -302,14 +371,30 @@ class OrganizeStage(EssayStage):
         else:
             return 5
     
-    def _get_ordinal(self, n: int) -> str:
-        ordinals = ['first', 'second', 'third', 'fourth', 'fifth']
-        return ordinals[n - 1] if n <= len(ordinals) else f'{n}th'
-    
     def validate(self, essay_data: EssayData) -> bool:
         return essay_data.outline is not None and len(essay_data.outline.sections) > 0
 
 
+_TREE_PROMPTS_INTRO = {
+    'T': 'Topic/Hook sentence - How will you grab attention?',
+    'R': 'Reasons preview - What main points will you cover?',
+    'E1': 'Explain context - What background does reader need?',
+    'E2': 'End with thesis - State your clear position'
+}
+_TREE_PROMPTS_CONCLUSION = {
+    'T': 'Topic sentence - Restate thesis in new words',
+    'R': 'Recap main reasons - Summarize key arguments',
+    'E1': 'Explain significance - Why does this matter?',
+    'E2': 'End strong - Final thought or call to action'
+}
+_TREE_PROMPTS_BODY = {
+    'T': 'Topic sentence - State main claim for this paragraph',
+    'R': 'Reasons/Evidence - What supports this claim?',
+    'E1': 'Explain/Analyze - How does evidence prove your point?',
+    'E2': 'End/Transition - Connect to next paragraph'
+}
+
+
 class WriteStage(EssayStage):
     """Stage 3: Write - Section-by-section drafting with TREE guidance"""
     
@@ -321,7 +406,7 @@ class WriteStage(EssayStage):
         print('Creating writing spaces for each section...\n')
         
         # Initialize sections from outline
-        essay_data.sections = [
+        essay_data.set_sections([
             EssaySection(
                 title=outline_section.title,
                 target_words=outline_section.word_count,
@@ -329,7 +414,7 @@ class WriteStage(EssayStage):
                 tree_prompts=self._generate_tree_prompts(outline_section.title)
             )
             for outline_section in essay_data.outline.sections
-        ]
+        ])
         
         self._display_writing_guidance(essay_data)
         
@@ -342,60 +427,59 @@ class WriteStage(EssayStage):
     def _generate_tree_prompts(self, section_title: str) -> Dict[str, str]:
         title_lower = section_title.lower()
         if 'introduction' in title_lower:
-            return {
-                'T': 'Topic/Hook sentence - How will you grab attention?',
-                'R': 'Reasons preview - What main points will you cover?',
-                'E1': 'Explain context - What background does reader need?',
-                'E2': 'End with thesis - State your clear position'
-            }
+            template = _TREE_PROMPTS_INTRO
         elif 'conclusion' in title_lower:
-            return {
-                'T': 'Topic sentence - Restate thesis in new words',
-                'R': 'Recap main reasons - Summarize key arguments',
-                'E1': 'Explain significance - Why does this matter?',
-                'E2': 'End strong - Final thought or call to action'
-            }
+            template = _TREE_PROMPTS_CONCLUSION
         else:
-            return {
-                'T': 'Topic sentence - State main claim for this paragraph',
-                'R': 'Reasons/Evidence - What supports this claim?',
-                'E1': 'Explain/Analyze - How does evidence prove your point?',
-                'E2': 'End/Transition - Connect to next paragraph'
-            }
+            template = _TREE_PROMPTS_BODY
+        # Each section gets its own copy so edits don't leak into the templates.
+        return dict(template)
     
     def _display_writing_guidance(self, essay_data: EssayData):
-        for i, section in enumerate(essay_data.sections, 1):
-            print(f"📝 Section {i}: {section.title}")
-            print(f"   Target: {section.target_words} words")
-            print(f"   Guide: {section.guiding_question}")
-            print('   TREE Structure:')
-            for key, prompt in section.tree_prompts.items():
-                print(f"     {key} - {prompt}")
-            print('')
+        if not essay_data.sections:
+            return
+        print('\n'.join(chain.from_iterable(
+            self._render_section(i, section)
+            for i, section in enumerate(essay_data.sections, 1)
+        )))
+    
+    def _render_section(self, i: int, section: EssaySection) -> List[str]:
+        lines = [
+            f"📝 Section {i}: {section.title}",
+            f"   Target: {section.target_words} words",
+            f"   Guide: {section.guiding_question}",
+            '   TREE Structure:'
+        ]
+        lines.extend(f"     {key} - {prompt}" for key, prompt in section.tree_prompts.items())
+        lines.append('')
+        return lines
     
     def add_content(self, essay_data: EssayData, section_index: int, content: str) -> Dict[str, Any]:
         if not (0 <= section_index < len(essay_data.sections)):
             raise IndexError('Invalid section index')
         
         section = essay_data.sections[section_index]
+        was_completed = section.completed
+        previous_words = section.actual_words
         section.content = content
         section.actual_words = self._count_words(content)
         section.completed = section.actual_words > 0
+        essay_data.completed_count += int(section.completed) - int(was_completed)
+        essay_data.total_words += section.actual_words - previous_words
         
         print(f"✓ Content added to {section.title}: {section.actual_words}/{section.target_words} words")
         
         # Check if all sections are completed
-        all_completed = all(s.completed for s in essay_data.sections)
+        all_completed = essay_data.completed_count == len(essay_data.sections)
         if all_completed:
             self.completed = True
-            total_words = sum(s.actual_words for s in essay_data.sections)
-            print(f"\n🎉 Draft completed! Total words: {total_words}/{essay_data.word_count}")
+            print(f"\n🎉 Draft completed! Total words: {essay_data.total_words}/{essay_data.word_count}")
         
         return {'completed': section.completed, 'total_completed': all_completed}
     
     def _count_words(self, text: str) -> int:
-        words = text.strip().split()
-        return len([word for word in words if word])
+        # split() already drops surrounding whitespace and never yields empties.
+        return len(text.split())
     
     def validate(self, essay_data: EssayData) -> bool:
         return (essay_data.sections and 
@@ -422,28 +506,29 @@ class ReviseStage(EssayStage):
         print('Running revision passes...\n')
         
         all_issues = []
+        # Split/lowercase each section once; every pass reads from these.
+        tokens = tokenize_sections(essay_data)
         
         for i, revision_pass in enumerate(self.passes, 1):
             print(f"🔍 Pass {i}: {revision_pass.name}")
-            issues = revision_pass.analyze(essay_data)
+            issues = revision_pass.analyze(essay_data, tokens)
             all_issues.extend(issues)
             
             if not issues:
                 print('   ✓ No issues found')
             else:
-                for issue in issues:
-                    print(f"   ⚠️  {issue.description} ({issue.location})")
+                print('\n'.join(f"   ⚠️  {issue.description} ({issue.location})" for issue in issues))
             print('')
         
-        essay_data.revision_passes = all_issues
-        high_priority_issues = [i for i in all_issues if i.severity == 'high']
-        self.completed = len(high_priority_issues) == 0
+        essay_data.set_revision_passes(all_issues)
+        severity_counts = Counter(i.severity for i in all_issues)
+        self.completed = severity_counts['high'] == 0
         
         print(f"📊 Revision Summary:")
         print(f"   Total issues found: {len(all_issues)}")
-        print(f"   High priority: {len([i for i in all_issues if i.severity == 'high'])}")
-        print(f"   Medium priority: {len([i for i in all_issues if i.severity == 'medium'])}")
-        print(f"   Low priority: {len([i for i in all_issues if i.severity == 'low'])}")
+        print(f"   High priority: {severity_counts['high']}")
+        print(f"   Medium priority: {severity_counts['medium']}")
+        print(f"   Low priority: {severity_counts['low']}")
         
         return {
             'ready': True,
@@ -453,12 +538,83 @@ class ReviseStage(EssayStage):
         }
     
     def validate(self, essay_data: EssayData) -> bool:
-        high_priority_issues = [i for i in essay_data.revision_passes if i.severity == 'high']
-        return len(high_priority_issues) == 0
+        return not any(i.severity == 'high' for i in essay_data.revision_passes)
 
 
 # ========== REVISION PASSES ==========
 
+_WORD_RE = re.compile(r'\b\w+\b')
+_QUOTE_RE = re.compile(r'"[^"]+"')
+# Starts with a literal so the matcher can jump between candidate "w"s instead
+# of trying every position; the leading word boundary is checked per match.
+_PASSIVE_RE = re.compile(r'w(?:as|ere)\s+\w+ed\b')
+_REPEATED_WORD_RE = re.compile(r'\b(\w+)\s+\1\b', re.IGNORECASE)
+
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
+                         'to', 'for', 'of', 'with', 'by'})
+# Claims and fillers are reported in the order listed here.
+_STRONG_CLAIMS = ('shows', 'proves', 'demonstrates', 'leads to', 'causes', 'results in')
+_EVIDENCE_MARKERS = ('"', 'example', 'study', 'research', 'data', 'according to', 'statistics')
+_TRANSITIONS = ('however', 'therefore', 'furthermore', 'moreover',
+                'in addition', 'consequently', 'thus', 'meanwhile')
+_FILLER_PHRASES = ('in general', 'it should be noted', 'actually', 'basically', 'literally')
+
+
+def _has_lowercase_after_punct(text: str) -> bool:
+    # Same test as re.search(r'[.!?]\s*[a-z]', text), but str.find skips
+    # between terminators instead of running the regex VM over every char.
+    n = len(text)
+    for mark in '.!?':
+        i = text.find(mark)
+        while i != -1:
+            j = i + 1
+            while j < n and text[j].isspace():
+                j += 1
+            if j < n and 'a' <= text[j] <= 'z':
+                return True
+            i = text.find(mark, i + 1)
+    return False
+
+
+def _count_passive(text: str) -> int:
+    count = 0
+    for m in _PASSIVE_RE.finditer(text):
+        start = m.start()
+        if start == 0 or not (text[start - 1].isalnum() or text[start - 1] == '_'):
+            count += 1
+    return count
+
+
+@dataclass(slots=True)
+class SectionTokens:
+    """Per-section text views shared by the revision passes"""
+    content_lower: str
+    sentences: List[str]  # split on '.', stripped, empties dropped
+    words: List[str]  # whitespace-split content_lower
+
+
+# A sentence runs to '.', '!' or '?'. Question and exclamation marks stay on
+# the sentence (StructurePass looks for '?'); periods are dropped.
+_SENT_RE = re.compile(r'[^.!?]*[!?]+|[^.!?]+')
+
+
+def _split_sentences(text: str) -> List[str]:
+    return [s for s in map(str.strip, _SENT_RE.findall(text)) if s]
+
+
+def tokenize_section(section: 'EssaySection') -> SectionTokens:
+    content_lower = section.content_lower
+    return SectionTokens(
+        content_lower=content_lower,
+        sentences=_split_sentences(section.content),
+        words=content_lower.split()
+    )
+
+
+def tokenize_sections(essay_data: EssayData) -> List[SectionTokens]:
+    return [tokenize_section(section) for section in essay_data.sections]
+
+
 class RevisionPass(ABC):
     """Abstract base class for revision passes"""
     
@@ -467,8 +623,9 @@ class RevisionPass(ABC):
         self.description = description
     
     @abstractmethod
-    def analyze(self, essay_data: EssayData) -> List[RevisionIssue]:
-        """Analyze essay and return issues"""
+    def analyze(self, essay_data: EssayData,
+                tokens: Optional[List[SectionTokens]] = None) -> List[RevisionIssue]:
+        """Analyze essay and return issues; `tokens` parallels essay_data.sections"""
         pass
 
 
@@ -478,17 +635,22 @@ class ThesisFocusPass(RevisionPass):
     def __init__(self):
         super().__init__('Thesis & Focus', 'Check connection between paragraphs and thesis')
     
-    def analyze(self, essay_data: EssayData) -> List[RevisionIssue]:
+    def analyze(self, essay_data: EssayData,
+                tokens: Optional[List[SectionTokens]] = None) -> List[RevisionIssue]:
         issues = []
+        tokens = tokens or tokenize_sections(essay_data)
         thesis_keywords = self._extract_keywords(essay_data.thesis)
-        
-        for section in essay_data.sections:
-            if ('introduction' in section.title.lower() or 
-                'conclusion' in section.title.lower()):
+        # Built once per run; the ratio still divides by the keyword list
+        # length, duplicates included.
+        thesis_set = frozenset(thesis_keywords)
+        thesis_count = len(thesis_keywords)
+        
+        for section, tok in zip(essay_data.sections, tokens):
+            title_lower = section.title.lower()
+            if 'introduction' in title_lower or 'conclusion' in title_lower:
                 continue  # Skip intro/conclusion
             
-            content_keywords = self._extract_keywords(section.content)
-            overlap = self._calculate_overlap(thesis_keywords, content_keywords)
+            overlap = self._calculate_overlap(thesis_set, thesis_count, tok.content_lower)
             
             if overlap < 0.2:  # Less than 20% keyword overlap
                 issues.append(RevisionIssue(
@@ -501,16 +663,18 @@ class ThesisFocusPass(RevisionPass):
         return issues
     
     def _extract_keywords(self, text: str) -> List[str]:
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 
-                     'to', 'for', 'of', 'with', 'by'}
-        words = re.findall(r'\b\w+\b', text.lower())
-        return [word for word in words if len(word) > 3 and word not in stop_words]
+        return self._keywords_in(text.lower())
+    
+    def _keywords_in(self, text_lower: str) -> List[str]:
+        words = _WORD_RE.findall(text_lower)
+        return [word for word in words if len(word) > 3 and word not in _STOP_WORDS]
     
-    def _calculate_overlap(self, keywords1: List[str], keywords2: List[str]) -> float:
-        if not keywords1:
+    def _calculate_overlap(self, thesis_set: frozenset, thesis_count: int, text_lower: str) -> float:
+        if not thesis_count:
             return 0
-        intersection = set(keywords1) & set(keywords2)
-        return len(intersection) / len(keywords1)
+        # Thesis keywords already pass the length/stop-word filter, so the
+        # section's raw words can be intersected without filtering them first.
+        return len(thesis_set.intersection(_WORD_RE.findall(text_lower))) / thesis_count
 
 
 class StructurePass(RevisionPass):
@@ -519,15 +683,17 @@ class StructurePass(RevisionPass):
     def __init__(self):
         super().__init__('Structure (TREE)', 'Validate paragraph structure')
     
-    def analyze(self, essay_data: EssayData) -> List[RevisionIssue]:
+    def analyze(self, essay_data: EssayData,
+                tokens: Optional[List[SectionTokens]] = None) -> List[RevisionIssue]:
         issues = []
+        tokens = tokens or tokenize_sections(essay_data)
         
-        for section in essay_data.sections:
+        for section, tok in zip(essay_data.sections, tokens):
             content = section.content
             if not content:
                 continue
             
-            sentences = [s.strip() for s in content.split('.') if s.strip()]
+            sentences = tok.sentences
             
             # Check for topic sentence
             if sentences:
@@ -542,11 +708,11 @@ class StructurePass(RevisionPass):
                     ))
             
             # Check for quotes without explanation
-            quotes = re.findall(r'"[^"]+"', content)
-            for quote in quotes:
-                quote_index = content.index(quote)
-                after_quote = content[quote_index + len(quote):quote_index + len(quote) + 100]
-                if len(after_quote.strip().split('.')[0]) < 20:
+            for match in _QUOTE_RE.finditer(content):
+                quote_end = match.end()
+                after_quote = content[quote_end:quote_end + 100].strip()
+                first_sentence = _SENT_RE.match(after_quote)
+                if first_sentence is None or len(first_sentence.group()) < 20:
                     issues.append(RevisionIssue(
                         'structure',
                         'Quote needs more analysis/explanation',
@@ -569,17 +735,18 @@ class ArgumentEvidencePass(RevisionPass):
     def __init__(self):
         super().__init__('Argument & Evidence', 'Check claims are supported with evidence')
     
-    def analyze(self, essay_data: EssayData) -> List[RevisionIssue]:
+    def analyze(self, essay_data: EssayData,
+                tokens: Optional[List[SectionTokens]] = None) -> List[RevisionIssue]:
         issues = []
-        strong_claim_words = ['shows', 'proves', 'demonstrates', 'leads to', 'causes', 'results in']
+        tokens = tokens or tokenize_sections(essay_data)
         
-        for section in essay_data.sections:
-            content = section.content.lower()
+        for section, tok in zip(essay_data.sections, tokens):
+            content = tok.content_lower
             
-            for claim_word in strong_claim_words:
-                if claim_word in content:
-                    # Check if there's nearby evidence
-                    claim_index = content.index(claim_word)
+            for claim_word in _STRONG_CLAIMS:
+                # Check every occurrence for nearby evidence; report the word once
+                claim_index = content.find(claim_word)
+                while claim_index != -1:
                     surrounding = content[max(0, claim_index - 100):claim_index + 200]
                     
                     if not self._has_evidence(surrounding):
@@ -589,17 +756,16 @@ class ArgumentEvidencePass(RevisionPass):
                             section.title,
                             'medium'
                         ))
+                        break
+                    claim_index = content.find(claim_word, claim_index + 1)
             
             # Check for consecutive quotes
-            quotes = re.findall(r'"[^"]+"', content)
+            quotes = list(_QUOTE_RE.finditer(content))
             if len(quotes) >= 2:
-                for i in range(len(quotes) - 1):
-                    quote1_end = content.index(quotes[i]) + len(quotes[i])
-                    quote2_start = content.index(quotes[i + 1])
-                    between = content[quote1_end:quote2_start]
+                for quote1, quote2 in zip(quotes, quotes[1:]):
+                    between = content[quote1.end():quote2.start()]
                     
-                    analysis_sentences = [s.strip() for s in between.split('.') 
-                                        if s.strip() and len(s.strip()) > 10]
+                    analysis_sentences = [s for s in _split_sentences(between) if len(s) > 10]
                     if len(analysis_sentences) < 2:
                         issues.append(RevisionIssue(
                             'evidence',
@@ -611,8 +777,7 @@ class ArgumentEvidencePass(RevisionPass):
         return issues
     
     def _has_evidence(self, text: str) -> bool:
-        evidence_markers = ['"', 'example', 'study', 'research', 'data', 'according to', 'statistics']
-        return any(marker in text for marker in evidence_markers)
+        return any(marker in text for marker in _EVIDENCE_MARKERS)
 
 
 class FlowCohesionPass(RevisionPass):
@@ -621,11 +786,13 @@ class FlowCohesionPass(RevisionPass):
     def __init__(self):
         super().__init__('Flow & Cohesion', 'Check sentence length and transitions')
     
-    def analyze(self, essay_data: EssayData) -> List[RevisionIssue]:
+    def analyze(self, essay_data: EssayData,
+                tokens: Optional[List[SectionTokens]] = None) -> List[RevisionIssue]:
         issues = []
+        tokens = tokens or tokenize_sections(essay_data)
         
-        for i, section in enumerate(essay_data.sections):
-            sentences = [s.strip() for s in section.content.split('.') if s.strip()]
+        for i, (section, tok) in enumerate(zip(essay_data.sections, tokens)):
+            sentences = tok.sentences
             
             for j, sentence in enumerate(sentences):
                 word_count = len(sentence.split())
@@ -639,7 +806,7 @@ class FlowCohesionPass(RevisionPass):
             
             # Check transitions between sections
             if 0 < i < len(essay_data.sections) - 1:
-                if not self._has_transition_words(section.content):
+                if not self._has_transition_words(tok.content_lower):
                     issues.append(RevisionIssue(
                         'cohesion',
                         'Consider adding transition words to connect ideas',
@@ -649,11 +816,8 @@ class FlowCohesionPass(RevisionPass):
         
         return issues
     
-    def _has_transition_words(self, text: str) -> bool:
-        transitions = ['however', 'therefore', 'furthermore', 'moreover', 
-                      'in addition', 'consequently', 'thus', 'meanwhile']
-        text_lower = text.lower()
-        return any(transition in text_lower for transition in transitions)
+    def _has_transition_words(self, text_lower: str) -> bool:
+        return any(transition in text_lower for transition in _TRANSITIONS)
 
 
 class StyleClarityPass(RevisionPass):
@@ -662,15 +826,16 @@ class StyleClarityPass(RevisionPass):
     def __init__(self):
         super().__init__('Style & Clarity', 'Check for filler words and passive voice')
     
-    def analyze(self, essay_data: EssayData) -> List[RevisionIssue]:
+    def analyze(self, essay_data: EssayData,
+                tokens: Optional[List[SectionTokens]] = None) -> List[RevisionIssue]:
         issues = []
-        filler_phrases = ['in general', 'it should be noted', 'actually', 'basically', 'literally']
+        tokens = tokens or tokenize_sections(essay_data)
         
-        for section in essay_data.sections:
-            content = section.content.lower()
+        for section, tok in zip(essay_data.sections, tokens):
+            content = tok.content_lower
             
             # Check filler phrases
-            for filler in filler_phrases:
+            for filler in _FILLER_PHRASES:
                 if filler in content:
                     issues.append(RevisionIssue(
                         'style',
@@ -680,27 +845,29 @@ class StyleClarityPass(RevisionPass):
                     ))
             
             # Check passive voice
-            passive_pattern = r'\bwas\s+\w+ed\b|\bwere\s+\w+ed\b'
-            passive_matches = re.findall(passive_pattern, content)
-            if len(passive_matches) > 2:
+            passive_count = _count_passive(content)
+            if passive_count > 2:
                 issues.append(RevisionIssue(
                     'style',
-                    f'Heavy use of passive voice ({len(passive_matches)} instances)',
+                    f'Heavy use of passive voice ({passive_count} instances)',
                     section.title,
                     'low'
                 ))
             
             # Check word repetition
-            words = content.split()
-            for j in range(len(words) - 2):
-                if words[j] == words[j + 1] or words[j] == words[j + 2]:
-                    issues.append(RevisionIssue(
-                        'style',
-                        f'Word repetition: "{words[j]}"',
-                        section.title,
-                        'low'
-                    ))
-                    break
+            words = tok.words
+            repeated = next(
+                (w for w, nxt, after in zip(words, words[1:], words[2:])
+                 if w == nxt or w == after),
+                None
+            )
+            if repeated is not None:
+                issues.append(RevisionIssue(
+                    'style',
+                    f'Word repetition: "{repeated}"',
+                    section.title,
+                    'low'
+                ))
         
         return issues
 
@@ -711,7 +878,8 @@ class WordCountPass(RevisionPass):
     def __init__(self):
         super().__init__('Word Count & Balance', 'Check word distribution and target compliance')
     
-    def analyze(self, essay_data: EssayData) -> List[RevisionIssue]:
+    def analyze(self, essay_data: EssayData,
+                tokens: Optional[List[SectionTokens]] = None) -> List[RevisionIssue]:
         issues = []
         total_actual = 0
         
@@ -746,52 +914,67 @@ class WordCountPass(RevisionPass):
         return issues
 
 
+# Sections shorter than this are cheaper to re-check than to hash for the cache.
+_MECHANICS_MEMO_MIN_CHARS = 200
+
+
+def _check_mechanics(content: str) -> Tuple[Tuple[str, str], ...]:
+    """Return (description, severity) pairs for one section's text"""
+    findings = []
+    
+    # Double spaces
+    idx = content.find('  ')
+    if idx != -1:
+        findings.append((f'Found double spaces near char {idx}', 'low'))
+    
+    # Repeated words
+    repeated_matches = _REPEATED_WORD_RE.findall(content)
+    if repeated_matches:
+        findings.append((f'Repeated words found: {", ".join(repeated_matches)}', 'medium'))
+    
+    # Basic punctuation
+    if _has_lowercase_after_punct(content):
+        findings.append(('Check capitalization after punctuation', 'medium'))
+    
+    return tuple(findings)
+
+
+# Revision is re-run after small edits, so most sections come back unchanged.
+_check_mechanics_cached = lru_cache(maxsize=64)(_check_mechanics)
+
+
 class SpellCheckPass(RevisionPass):
     """Basic spelling and grammar checks"""
     
     def __init__(self):
         super().__init__('Spell Check & Mechanics', 'Basic spelling and grammar checks')
     
-    def analyze(self, essay_data: EssayData) -> List[RevisionIssue]:
+    def analyze(self, essay_data: EssayData,
+                tokens: Optional[List[SectionTokens]] = None) -> List[RevisionIssue]:
         issues = []
         
         for section in essay_data.sections:
             content = section.content
-            
-            # Double spaces
-            if '  ' in content:
-                issues.append(RevisionIssue(
-                    'mechanics',
-                    'Found double spaces',
-                    section.title,
-                    'low'
-                ))
-            
-            # Repeated words
-            repeated_pattern = r'\b(\w+)\s+\1\b'
-            repeated_matches = re.findall(repeated_pattern, content, re.IGNORECASE)
-            if repeated_matches:
-                issues.append(RevisionIssue(
-                    'mechanics',
-                    f'Repeated words found: {", ".join(repeated_matches)}',
-                    section.title,
-                    'medium'
-                ))
-            
-            # Basic punctuation
-            if re.search(r'[.!?]\s*[a-z]', content):
-                issues.append(RevisionIssue(
-                    'mechanics',
-                    'Check capitalization after punctuation',
-                    section.title,
-                    'medium'
-                ))
+            if len(content) >= _MECHANICS_MEMO_MIN_CHARS:
+                findings = _check_mechanics_cached(content)
+            else:
+                findings = _check_mechanics(content)
+            # Fresh issue objects each run; callers may mark them resolved.
+            issues.extend(
+                RevisionIssue('mechanics', description, section.title, severity)
+                for description, severity in findings
+            )
         
         return issues
 
 
 # ========== MAIN ESSAY ASSISTANT TASK ==========
 
+_ESSAY_TYPES = ('opinion', 'analytical', 'comparative', 'interpretive')
+_VALID_ESSAY_TYPES = frozenset(_ESSAY_TYPES)
+_VALID_ESSAY_TYPES_MSG = ', '.join(_ESSAY_TYPES)
+
+@TaskFactory.register('essay')
 class EssayAssistantTask(Task):
     """Main essay assistant task implementing SRSD methodology"""
     
@@ -818,9 +1001,8 @@ class EssayAssistantTask(Task):
         if not topic:
             errors.append('Topic is required')
         
-        valid_types = ['opinion', 'analytical', 'comparative', 'interpretive']
-        if essay_type not in valid_types:
-            errors.append(f'Valid essay type is required ({", ".join(valid_types)})')
+        if essay_type not in _VALID_ESSAY_TYPES:
+            errors.append(f'Valid essay type is required ({_VALID_ESSAY_TYPES_MSG})')
         
         if not isinstance(word_count, int) or not (100 <= word_count <= 5000):
             errors.append('Word count must be between 100 and 5000')
@@ -839,7 +1021,7 @@ class EssayAssistantTask(Task):
         self.essay_data.topic = topic
         self.essay_data.essay_type = essay_type
         self.essay_data.word_count = word_count
-        self.essay_data.deadline = datetime.fromisoformat(deadline) if isinstance(deadline, str) else deadline
+        self.essay_data.deadline = deadline_dt
         
         return True
     
@@ -870,27 +1052,20 @@ class EssayAssistantTask(Task):
             raise ValueError('Not enough time to complete essay')
         
         # Distribute days across stages
+        ideas_days = organize_days = 1
         if total_days >= 7:
-            stage_distribution = {
-                'ideas': 1,
-                'organize': 1, 
-                'write': max(2, int(total_days * 0.6)),
-                'revise': max(1, int(total_days * 0.3))
-            }
+            write_days = max(2, int(total_days * 0.6))
+            revise_days = max(1, int(total_days * 0.3))
         else:
-            stage_distribution = {
-                'ideas': 1,
-                'organize': 1,
-                'write': max(1, total_days - 2),
-                'revise': 1
-            }
-        
-        stages = [
-            {'name': 'Pick Ideas', 'days': stage_distribution['ideas'], 'start_day': 1},
-            {'name': 'Organize', 'days': stage_distribution['organize'], 'start_day': 1 + stage_distribution['ideas']},
-            {'name': 'Write', 'days': stage_distribution['write'], 'start_day': 2 + stage_distribution['ideas']},
-            {'name': 'Revise', 'days': stage_distribution['revise'], 'start_day': 2 + stage_distribution['ideas'] + stage_distribution['write']}
-        ]
+            write_days = max(1, total_days - 2)
+            revise_days = 1
+        
+        stages = (
+            TimelineStage('Pick Ideas', ideas_days, 1),
+            TimelineStage('Organize', organize_days, 1 + ideas_days),
+            TimelineStage('Write', write_days, 2 + ideas_days),
+            TimelineStage('Revise', revise_days, 2 + ideas_days + write_days)
+        )
         
         self.timeline = {
             'total_days': total_days,
@@ -901,9 +1076,9 @@ class EssayAssistantTask(Task):
         """Display the suggested timeline"""
         print('\n📅 SUGGESTED TIMELINE:')
         for i, stage in enumerate(self.timeline['stages'], 1):
-            end_day = stage['start_day'] + stage['days'] - 1
-            days_text = f"Day {stage['start_day']}" + (f"-{end_day}" if stage['days'] > 1 else "")
-            print(f"   {i}. {stage['name']}: {days_text} ({stage['days']} day{'s' if stage['days'] > 1 else ''})")
+            end_day = stage.start_day + stage.days - 1
+            days_text = f"Day {stage.start_day}" + (f"-{end_day}" if stage.days > 1 else "")
+            print(f"   {i}. {stage.name}: {days_text} ({stage.days} day{'s' if stage.days > 1 else ''})")
     
     def _execute_current_stage(self) -> Dict[str, Any]:
         """Execute the current stage"""
@@ -949,8 +1124,6 @@ class EssayAssistantTask(Task):
     
     def get_essay_status(self) -> Dict[str, Any]:
         """Get comprehensive essay status"""
-        total_words = sum(section.actual_words for section in self.essay_data.sections)
-        
         return {
             'task_id': self.id,
             'status': self.status.value,
@@ -962,33 +1135,51 @@ class EssayAssistantTask(Task):
                 'essay_type': self.essay_data.essay_type,
                 'thesis': self.essay_data.thesis,
                 'target_words': self.essay_data.word_count,
-                'actual_words': total_words,
+                'actual_words': self.essay_data.total_words,
                 'sections': len(self.essay_data.sections),
-                'completed_sections': len([s for s in self.essay_data.sections if s.completed]),
+                'completed_sections': self.essay_data.completed_count,
                 'issues': len(self.essay_data.revision_passes),
-                'high_priority_issues': len([i for i in self.essay_data.revision_passes if i.severity == 'high'])
+                'high_priority_issues': self.essay_data.high_issue_count
             },
-            'timeline': self.timeline
+            'timeline': self.timeline and {
+                'total_days': self.timeline['total_days'],
+                'stages': [stage.to_dict() for stage in self.timeline['stages']]
+            }
         }
     
     def get_full_essay_text(self) -> str:
         """Get the complete essay text"""
+        # isspace() tests for blank content without building a stripped copy
         return '\n\n'.join(
-            section.content for section in self.essay_data.sections 
-            if section.content.strip()
+            content for content in (section.content for section in self.essay_data.sections)
+            if content and not content.isspace()
         )
 
 
  # ========== READING ASSISTANT TASK ==========
  
-@dataclass
+_PARA_SPLIT_RE = re.compile(r'\n\s*\n')
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+@dataclass(slots=True, frozen=True)
 class ReadingChunk:
     source_id: str
     source_title: str
     paragraph_index: int  # 1-based index
     total_paragraphs_for_source: int
     text: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'source_id': self.source_id,
+            'source_title': self.source_title,
+            'paragraph_index': self.paragraph_index,
+            'total_paragraphs_for_source': self.total_paragraphs_for_source,
+            'text': self.text
+        }
 
+@TaskFactory.register('reading')
 class ReadingAssistantTask(Task):
     """Task that helps read multiple texts by interleaving their paragraphs.
 
@@ -1002,10 +1193,18 @@ class ReadingAssistantTask(Task):
     def __init__(self, params: Dict[str, Any]):
         super().__init__(params)
         self.sources: List[Dict[str, Any]] = []  # each: {id, title, paragraphs}
-        self.queue: List[ReadingChunk] = []
-        self.current_index: int = 0
+        self.current_index: int = 0  # chunks delivered so far
+        self.total_chunks: int = 0
         self.shuffle_each_round: bool = True
         self._rng: random.Random = random.Random()
+        # Interleaving state: chunks are produced one paragraph round at a time
+        # as they are requested, not materialized up front.
+        self._round: int = 0
+        self._plens: List[int] = []
+        self._active: List[int] = []
+        self._order: List[int] = []
+        self._order_pos: int = 0
+        self._next_chunk: Optional[ReadingChunk] = None
 
     # ---- lifecycle ----
     def validate_params(self) -> bool:
@@ -1050,44 +1249,38 @@ class ReadingAssistantTask(Task):
         print(f'Sources: {len(self.sources)}')
         for i, s in enumerate(self.sources, 1):
             print(f"   {i}. {s['title']} ({len(s['paragraphs'])} paragraphs)")
-        print(f'Total interleaved chunks: {len(self.queue)}')
+        print(f'Total interleaved chunks: {self.total_chunks}')
 
         return self._preview_next()
 
     # ---- public API ----
     def get_next_chunk(self) -> Dict[str, Any]:
         """Return the next interleaved paragraph chunk (and advance)."""
-        if self.current_index >= len(self.queue):
+        chunk = self._peek()
+        if chunk is None:
             self.status = TaskStatus.COMPLETED
             return {'completed': True, 'message': 'No more chunks.'}
-        chunk = self.queue[self.current_index]
+        self._next_chunk = None
         self.current_index += 1
-        if self.current_index >= len(self.queue):
+        if self.current_index >= self.total_chunks:
             self.status = TaskStatus.COMPLETED
         return {
             'chunk_number': self.current_index,
-            'total_chunks': len(self.queue),
-            'chunk': chunk.__dict__,
-            'remaining': len(self.queue) - self.current_index,
+            'total_chunks': self.total_chunks,
+            'chunk': chunk.to_dict(),
+            'remaining': self.total_chunks - self.current_index,
             'completed': self.status == TaskStatus.COMPLETED
         }
 
     def get_reading_status(self) -> Dict[str, Any]:
         """Detailed status for TaskManager.get_task_status()."""
-        next_meta = None
-        if self.current_index < len(self.queue):
-            nxt = self.queue[self.current_index]
-            next_meta = {
-                'source_id': nxt.source_id,
-                'source_title': nxt.source_title,
-                'paragraph_index': nxt.paragraph_index,
-                'total_paragraphs_for_source': nxt.total_paragraphs_for_source
-            }
+        nxt = self._peek()
+        next_meta = self._chunk_meta(nxt) if nxt is not None else None
         return {
             'task_id': self.id,
             'status': self.status.value,
             'type': self.type,
-            'progress': f"{round((self.current_index / max(1, len(self.queue))) * 100)}%",
+            'progress': f"{round((self.current_index / max(1, self.total_chunks)) * 100)}%",
             'sources': [
                 {
                     'id': s['id'],
@@ -1096,21 +1289,29 @@ class ReadingAssistantTask(Task):
                 } for s in self.sources
             ],
             'delivered': self.current_index,
-            'remaining': max(0, len(self.queue) - self.current_index),
-            'total_chunks': len(self.queue),
+            'remaining': max(0, self.total_chunks - self.current_index),
+            'total_chunks': self.total_chunks,
             'next_chunk': next_meta
         }
 
     # ---- internals ----
     def _split_into_paragraphs(self, text: str) -> List[str]:
         # Normalize newlines
-        normalized = re.sub(r'\r\n?', '\n', text)
-        normalized = re.sub(r'\n{3,}', '\n\n', normalized)
-        paragraphs = [p.strip() for p in re.split(r'\n\s*\n', normalized) if p.strip()]
+        normalized = text.replace('\r\n', '\n').replace('\r', '\n')
+        paragraphs = []
+        for part in normalized.split('\n\n'):
+            part = part.strip()
+            if not part:
+                continue
+            if '\n' in part:
+                # A whitespace-only line inside the part still separates paragraphs
+                paragraphs.extend(p.strip() for p in _PARA_SPLIT_RE.split(part) if p.strip())
+            else:
+                paragraphs.append(part)
 
         # Fallback: if there is a single very long block, chunk by sentences
         if len(paragraphs) == 1:
-            sentences = re.split(r'(?<=[.!?])\s+', paragraphs[0])
+            sentences = _SENT_SPLIT_RE.split(paragraphs[0])
             max_sent = int(self.params.get('sentences_per_fallback_paragraph', 8))
             if len(sentences) > max_sent:
                 paragraphs = [
@@ -1121,45 +1322,77 @@ class ReadingAssistantTask(Task):
         return paragraphs
 
     def _build_queue(self) -> None:
-        max_len = max(len(s['paragraphs']) for s in self.sources)
-        queue: List[ReadingChunk] = []
-        for p_idx in range(max_len):
-            order = [i for i, s in enumerate(self.sources) if p_idx < len(s['paragraphs'])]
-            if self.shuffle_each_round and len(order) > 1:
-                self._rng.shuffle(order)
-            for i in order:
-                s = self.sources[i]
-                queue.append(
-                    ReadingChunk(
-                        source_id=s['id'],
-                        source_title=s['title'],
-                        paragraph_index=p_idx + 1,
-                        total_paragraphs_for_source=len(s['paragraphs']),
-                        text=s['paragraphs'][p_idx]
-                    )
-                )
-        self.queue = queue
+        self._plens = [len(s['paragraphs']) for s in self.sources]
+        self.total_chunks = sum(self._plens)
         self.current_index = 0
+        self._round = 0
+        self._active = list(range(len(self.sources)))
+        self._order = []
+        self._order_pos = 0
+        self._next_chunk = None
+
+    def _advance_round(self) -> None:
+        # Rounds are shuffled in the same sequence as an eager build would,
+        # so a seeded task still yields the same interleaving.
+        p_idx = self._round
+        # Drop exhausted sources in place, keeping source order for the shuffle
+        active, plens = self._active, self._plens
+        keep = 0
+        for i in active:
+            if p_idx < plens[i]:
+                active[keep] = i
+                keep += 1
+        del active[keep:]
+        order = self._order
+        order[:] = active
+        if self.shuffle_each_round and len(order) > 1:
+            self._rng.shuffle(order)
+        self._order_pos = 0
+        self._round += 1
+
+    def _peek(self) -> Optional[ReadingChunk]:
+        """Next undelivered chunk, built on first request; None when done."""
+        if self._next_chunk is None and self.current_index < self.total_chunks:
+            while self._order_pos >= len(self._order):
+                self._advance_round()
+            s = self.sources[self._order[self._order_pos]]
+            self._order_pos += 1
+            p_idx = self._round - 1
+            self._next_chunk = ReadingChunk(
+                source_id=s['id'],
+                source_title=s['title'],
+                paragraph_index=p_idx + 1,
+                total_paragraphs_for_source=len(s['paragraphs']),
+                text=s['paragraphs'][p_idx]
+            )
+        return self._next_chunk
+
+    @staticmethod
+    def _chunk_meta(chunk: ReadingChunk) -> Dict[str, Any]:
+        """Chunk position without its text, for previews and status."""
+        return {
+            'source_id': chunk.source_id,
+            'source_title': chunk.source_title,
+            'paragraph_index': chunk.paragraph_index,
+            'total_paragraphs_for_source': chunk.total_paragraphs_for_source
+        }
 
     def _preview_next(self) -> Dict[str, Any]:
-        if self.current_index >= len(self.queue):
+        nxt = self._peek()
+        if nxt is None:
             self.status = TaskStatus.COMPLETED
             return {'completed': True, 'message': 'All chunks delivered', 'remaining': 0}
-        nxt = self.queue[self.current_index]
         return {
             'ready': True,
             'message': 'Use TaskManager.advance_task(task_id) to pull the next chunk.',
-            'next_chunk_meta': {
-                'source_id': nxt.source_id,
-                'source_title': nxt.source_title,
-                'paragraph_index': nxt.paragraph_index,
-                'total_paragraphs_for_source': nxt.total_paragraphs_for_source
-            },
-            'remaining': len(self.queue) - self.current_index
+            'next_chunk_meta': self._chunk_meta(nxt),
+            'remaining': self.total_chunks - self.current_index
         }
 
 # ========== TASK MANAGER ==========
 
+_TASK_SUMMARY_FIELDS = attrgetter('id', 'type', 'status.value', 'created_at_iso')
+
 class TaskManager:
     """Manages multiple tasks and their lifecycle"""
     
@@ -1174,9 +1407,10 @@ class TaskManager:
     
     def get_task(self, task_id: str) -> Task:
         """Get a task by ID"""
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             raise KeyError(f'Task not found: {task_id}')
-        return self.tasks[task_id]
+        return task
     
     def start_task(self, task_id: str) -> Dict[str, Any]:
         """Start a task"""
@@ -1206,21 +1440,13 @@ class TaskManager:
     def get_all_tasks(self) -> List[Dict[str, Any]]:
         """Get all tasks summary"""
         return [
-            {
-                'id': task.id,
-                'type': task.type,
-                'status': task.status.value,
-                'created_at': task.created_at.isoformat()
-            }
-            for task in self.tasks.values()
+            {'id': task_id, 'type': task_type, 'status': status, 'created_at': created_at}
+            for task_id, task_type, status, created_at in map(_TASK_SUMMARY_FIELDS, self.tasks.values())
         ]
     
     def delete_task(self, task_id: str) -> bool:
         """Delete a task"""
-        if task_id in self.tasks:
-            del self.tasks[task_id]
-            return True
-        return False
+        return self.tasks.pop(task_id, None) is not None
 
 
 # ========== TESTING / DEMO CODE ==========
@@ -1415,7 +1641,7 @@ As we navigate this digital transformation, we must resist both uncritical enthu
         
         # Test revision passes
         print('\nTesting revision passes...')
-        essay_data.sections = [
+        essay_data.set_sections([
             EssaySection(
                 'Introduction', 
                 100, 
@@ -1430,7 +1656,7 @@ As we navigate this digital transformation, we must resist both uncritical enthu
                 actual_words=12,
                 completed=True
             )
-        ]
+        ])
         
         revise_stage = ReviseStage()
         revision_result = revise_stage.execute(essay_data)
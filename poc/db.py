@@ -1,23 +1,76 @@
+import atexit
 import os
+import threading
 import uuid
 from contextlib import contextmanager
 from typing import Any, Dict, Iterable, Optional
 
 import psycopg
 from psycopg.rows import dict_row
-from psycopg.types.json import Json
+from psycopg.types.json import Json, set_json_dumps, set_json_loads
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError:
+    ConnectionPool = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+# Assignment params and submission state are stored as jsonb; use orjson for
+# both directions when it is installed.
+if orjson is not None:
+    set_json_dumps(_orjson_dumps)
+    set_json_loads(orjson.loads)
 
 
 def get_database_url() -> Optional[str]:
     return os.getenv("DATABASE_URL")
 
 
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(db_url: str):
+    # Created on first use and shared by every session in the process, so
+    # queries reuse warm connections instead of reconnecting each time.
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    db_url,
+                    min_size=4,
+                    max_size=20,
+                    kwargs={"row_factory": dict_row},
+                    # Test connections on checkout so ones dropped by the
+                    # server or a proxy are replaced instead of handed out
+                    check=ConnectionPool.check_connection,
+                    max_idle=300,
+                    open=True,
+                )
+                atexit.register(_pool.close)
+    return _pool
+
+
 @contextmanager
 def get_conn():
     db_url = get_database_url()
     if not db_url:
         raise RuntimeError("DATABASE_URL is not set.")
-    with psycopg.connect(db_url, row_factory=dict_row) as conn:
+    if ConnectionPool is None:
+        with psycopg.connect(db_url, row_factory=dict_row) as conn:
+            yield conn
+        return
+    with _get_pool(db_url).connection() as conn:
         yield conn
 
 
@@ -49,6 +102,9 @@ def ensure_schema() -> None:
         updated_at timestamptz NOT NULL DEFAULT now(),
         UNIQUE (assignment_id, user_id)
     );
+
+    CREATE INDEX IF NOT EXISTS idx_submissions_user_updated
+        ON submissions (user_id, updated_at DESC);
     """
     with get_conn() as conn:
         conn.execute(ddl)
@@ -64,16 +120,19 @@ def get_or_create_user(email: str, name: Optional[str], picture_url: Optional[st
         if existing:
             return existing
 
-        user_id = uuid.uuid4()
-        conn.execute(
+        # A concurrent first login may insert the same email; the no-op update
+        # lets RETURNING hand back that row instead of raising.
+        user = conn.execute(
             """
             INSERT INTO users (id, email, name, picture_url)
             VALUES (%s, %s, %s, %s)
+            ON CONFLICT (email) DO UPDATE SET email = EXCLUDED.email
+            RETURNING *
             """,
-            (user_id, email, name, picture_url),
-        )
+            (uuid.uuid4(), email, name, picture_url),
+        ).fetchone()
         conn.commit()
-        return conn.execute("SELECT * FROM users WHERE id = %s", (user_id,)).fetchone()
+        return user
 
 
 def create_assignment(
@@ -84,15 +143,16 @@ def create_assignment(
 ) -> Dict[str, Any]:
     assignment_uuid = uuid.UUID(assignment_id) if assignment_id else uuid.uuid4()
     with get_conn() as conn:
-        conn.execute(
+        assignment = conn.execute(
             """
             INSERT INTO assignments (id, task_type, params, created_by)
             VALUES (%s, %s, %s, %s)
+            RETURNING *
             """,
             (assignment_uuid, task_type, Json(params), created_by),
-        )
+        ).fetchone()
         conn.commit()
-        return conn.execute("SELECT * FROM assignments WHERE id = %s", (assignment_uuid,)).fetchone()
+        return assignment
 
 
 def get_assignment(assignment_id: str) -> Optional[Dict[str, Any]]:
@@ -150,15 +210,16 @@ def create_submission(
 ) -> Dict[str, Any]:
     submission_uuid = uuid.UUID(submission_id) if submission_id else uuid.uuid4()
     with get_conn() as conn:
-        conn.execute(
+        submission = conn.execute(
             """
             INSERT INTO submissions (id, assignment_id, user_id, state)
             VALUES (%s, %s, %s, %s)
+            RETURNING *
             """,
             (submission_uuid, assignment_id, user_id, Json(state)),
-        )
+        ).fetchone()
         conn.commit()
-        return conn.execute("SELECT * FROM submissions WHERE id = %s", (submission_uuid,)).fetchone()
+        return submission
 
 
 def update_submission_state(submission_id: str, state: Dict[str, Any]) -> None:
@@ -1,16 +1,17 @@
 # main.py
-import subprocess
+import os
 import sys
 
 def main():
     """Launch the Streamlit UI."""
     try:
-        print("🚀 Starting Essay & Reading Assistant UI...")
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "ui_app.py"])
+        print("🚀 Starting Essay & Reading Assistant UI...", flush=True)
+        # Replace this launcher process with Streamlit instead of waiting on a child.
+        os.execvp(sys.executable, [sys.executable, "-m", "streamlit", "run", "ui_app.py"])
     except KeyboardInterrupt:
         print("\n🛑 Exiting gracefully.")
     except Exception as e:
         print(f"❌ Failed to start UI: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
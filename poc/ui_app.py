@@ -291,8 +291,7 @@ def sidebar_ui(show_tasks: bool, manager: TaskManager, user: Dict[str, Any]):
                 try:
                     from assistant_core import call_llm
                     with st.spinner("Connecting to Grok..."):
-                        resp = call_llm("Say 'xAI Connection Successful'", temperature=0.1)
-                        st.success(f"{resp}")
+                        st.write_stream(call_llm("Say 'xAI Connection Successful'", temperature=0.1, stream=True))
                 except Exception as e:
                     st.error(f"Connection Failed:\n{e}")
 
@@ -503,7 +502,13 @@ def render_essay_ui(task: EssayAssistantTask, persist_fn):
             if st.button("💡 Get xAI Suggestions"):
                 try:
                     with st.spinner("Asking Grok..."):
-                        task.generate_thesis_suggestions()
+                        try:
+                            task.bootstrap_with_llm()
+                        except ValueError:
+                            # Plan reply wasn't valid JSON; the per-step request below still works
+                            pass
+                        if not task.essay_data.thesis_suggestions:
+                            task.generate_thesis_suggestions()
                         if not task.essay_data.thesis_suggestions:
                             st.warning("Grok didn't return a list. Try again.")
                         else: